@@ -1,64 +1,338 @@
 import sys
 import os
 import json
-import requests
+import functools
+import hashlib
+import re
+import shutil
 import threading
 import time
 from datetime import datetime, timezone
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, urljoin
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QLabel
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QLabel,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionButton, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QObject
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QObject, QTimer, QRunnable, QThreadPool, QEvent, QSize
+from PySide6.QtGui import QTextDocument, QAbstractTextDocumentLayout, QPalette, QColor, QPainter
 
-from bs4 import BeautifulSoup  # pip install beautifulsoup4
+try:
+    import lxml.html  # pip install lxml
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+# Окончание ".zip" в любом регистре, без .lower() для каждой строки
+ZIP_SUFFIX_RE = re.compile(r"\.zip\Z", re.IGNORECASE)
+
+# <meta charset="..."> или <meta http-equiv=... content="...; charset=..."> в начале страницы
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# Из страницы мода для BeautifulSoup нужны только эти теги, остальное дерево не строим
+MOD_PAGE_TAGS = ["div", "a", "h1"]
+
+if lxml is not None:
+    # XPath компилируется один раз, поиск по ссылкам идёт целиком в C
+    MOD_TITLE_XPATH = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' modtitle ')]")
+    MOD_INFO_XPATH = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' modinfo ')]")
+    ZIP_HREF_XPATH = etree.XPath(
+        "//a[translate(substring(@href, string-length(@href) - 3), 'ZIP', 'zip') = '.zip']/@href"
+    )
+
+try:
+    import orjson  # pip install orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # pip install selectolax
+except ImportError:
+    LexborHTMLParser = None
+
+
+# (соединение, чтение) в секундах: зависший сервер не блокирует опрос и загрузку
+HTTP_TIMEOUT = (5, 30)
+
+# GraphQL позволяет узнать последние релизы многих репозиториев одним запросом,
+# но работает только с токеном (переменная окружения GITHUB_TOKEN)
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_GRAPHQL_BATCH = 50
+GITHUB_RELEASE_FIELDS = "latestRelease { tagName publishedAt releaseAssets(first: 50) { nodes { name downloadUrl } } }"
 
 
 class WorkerSignals(QObject):
     progress = Signal(str)  # текст статуса
+    download_started = Signal(int)  # размер скачиваемого файла в байтах (0, если неизвестен)
+    download_finished = Signal(str)  # итоговое сообщение: о завершении или об ошибке
+    result = Signal(object)  # (url, release, error, validators) для одного URL
+
+
+# Роли данных ячейки «Действия»
+URL_ROLE = Qt.UserRole
+IS_NEW_ROLE = Qt.UserRole + 1
+
+
+class RichTextDelegate(QStyledItemDelegate):
+    # Рисует HTML из текста ячейки (дата релиза) без отдельного QLabel на строку
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._docs = {}
+
+    def document(self, html):
+        doc = self._docs.get(html)
+        if doc is None:
+            if len(self._docs) > 512:
+                self._docs.clear()
+            doc = QTextDocument()
+            doc.setHtml(html)
+            self._docs[html] = doc
+        return doc
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        doc = self.document(opt.text)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)  # фон и выделение
+
+        text_rect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, opt.widget)
+        painter.save()
+        painter.translate(text_rect.left(), text_rect.top() + (text_rect.height() - doc.size().height()) / 2)
+        painter.setClipRect(0, 0, text_rect.width(), text_rect.height())
+        ctx = QAbstractTextDocumentLayout.PaintContext()
+        if opt.state & QStyle.State_Selected:
+            ctx.palette.setColor(QPalette.Text, opt.palette.color(QPalette.HighlightedText))
+        doc.documentLayout().draw(painter, ctx)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        doc = self.document(index.data(Qt.DisplayRole) or "")
+        return QSize(int(doc.idealWidth()), int(doc.size().height()))
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    # Рисует кнопку «Скачать» в ячейке вместо QPushButton на каждую строку
+    clicked = Signal(str)  # URL из URL_ROLE
+
+    def button_option(self, option, index):
+        opt = QStyleOptionButton()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.text = index.data(Qt.DisplayRole) or ""
+        opt.state = QStyle.State_Enabled | QStyle.State_Raised
+        return opt
+
+    def paint(self, painter, option, index):
+        opt = self.button_option(option, index)
+        if index.data(IS_NEW_ROLE):
+            # Жёлтую кнопку рисуем сами: нативные стили Windows (windowsvista,
+            # windows11) берут фон кнопки из темы и палитру не учитывают
+            painter.save()
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QColor("darkgoldenrod"))
+            painter.setBrush(QColor("yellow"))
+            painter.drawRoundedRect(opt.rect.adjusted(0, 0, -1, -1), 3, 3)
+            painter.setPen(QColor("black"))  # на жёлтом фоне, в том числе в тёмной теме
+            painter.drawText(opt.rect, Qt.AlignCenter | Qt.TextShowMnemonic, opt.text)
+            painter.restore()
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, opt, painter, option.widget)
+
+    def sizeHint(self, option, index):
+        opt = self.button_option(option, index)
+        style = option.widget.style() if option.widget else QApplication.style()
+        text_size = option.fontMetrics.size(Qt.TextShowMnemonic, opt.text)
+        return style.sizeFromContents(QStyle.CT_PushButton, opt, text_size, option.widget)
 
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.clicked.emit(index.data(URL_ROLE))
+            return True
+        return super().editorEvent(event, model, option, index)
 
-def parse_farming_simulator_mod(url):
+
+class ReleasePollRunnable(QRunnable):
+    def __init__(self, fetch, url, kind, signals):
+        super().__init__()
+        self.fetch = fetch
+        self.url = url
+        self.kind = kind
+        self.signals = signals
+
+    def run(self):
+        result = self.fetch(self.url, self.kind)
+        try:
+            self.signals.result.emit(result)
+        except RuntimeError:
+            pass  # Окно уже закрыто и объект сигналов удалён
+
+
+class GitHubBatchRunnable(QRunnable):
+    def __init__(self, fetch_batch, urls, token, signals):
+        super().__init__()
+        self.fetch_batch = fetch_batch
+        self.urls = urls
+        self.token = token
+        self.signals = signals
+
+    def run(self):
+        try:
+            for result in self.fetch_batch(self.urls, self.token):
+                self.signals.result.emit(result)
+        except RuntimeError:
+            pass  # Окно уже закрыто и объект сигналов удалён
+
+
+def create_session():
+    # requests импортируется здесь, а не при запуске: сессия создаётся
+    # уже после показа окна, перед первым сетевым запросом
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Одна сессия на всё приложение: соединения с github.com и
+    # farming-simulator.com переиспользуются, TLS-рукопожатие не повторяется
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                      "AppleWebKit/537.36 (KHTML, like Gecko) "
+                      "Chrome/58.0.3029.110 Safari/537.3",
+        "Accept": "application/vnd.github+json, text/html;q=0.9, */*;q=0.8"
+    })
+    # Повторы с нарастающей паузой при сбоях сервера; Retry-After от GitHub учитывается
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries))
+    for host in ("https://api.github.com", "https://github.com",
+                 "https://www.farming-simulator.com", "https://farming-simulator.com"):
+        session.mount(host, HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+    return session
+
+
+def html_charset(html):
+    # Кодировка из <meta> в первых 1024 байтах (как при разборе в браузере), иначе UTF-8
+    match = META_CHARSET_RE.search(html, 0, 1024)
+    return match.group(1).decode("ascii") if match else "utf-8"
+
+
+def scan_mod_page(html, encoding=None):
+    # html — str или bytes; возвращает (название, тексты блоков modinfo, ссылка на zip).
+    # encoding — кодировка из заголовка ответа, если сервер её указал; без неё bs4
+    # и libxml2 находят <meta charset> сами, а selectolax всегда читает байты как
+    # UTF-8, поэтому для него страница декодируется здесь
+    if LexborHTMLParser is not None:
+        if isinstance(html, bytes):
+            try:
+                html = html.decode(encoding or html_charset(html), errors="replace")
+            except LookupError:  # неизвестное имя кодировки
+                html = html.decode("utf-8", errors="replace")
+        tree = LexborHTMLParser(html)
+        title_tag = tree.css_first("div.modtitle") or tree.css_first("h1")
+        name = title_tag.text().strip() if title_tag else "N/A"
+        infos = [info.text(separator="\n") for info in tree.css("div.modinfo")]
+        link = tree.css_first("a[href$='.zip' i]")
+        zip_url = link.attributes.get("href") if link else None
+        return name, infos, zip_url
+
+    if lxml is not None:
+        if isinstance(html, bytes) and encoding:
+            root = lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+        else:
+            root = lxml.html.fromstring(html)
+        titles = MOD_TITLE_XPATH(root) or root.findall(".//h1")
+        name = titles[0].text_content().strip() if titles else "N/A"
+        infos = ["\n".join(info.itertext()) for info in MOD_INFO_XPATH(root)]
+        zip_hrefs = ZIP_HREF_XPATH(root)
+        return name, infos, (str(zip_hrefs[0]) if zip_hrefs else None)
+
+    # Запасной вариант, если не установлены ни selectolax, ни lxml.
+    # bs4 импортируется только здесь, чтобы не тратить на него время при запуске
+    from bs4 import BeautifulSoup, SoupStrainer  # pip install beautifulsoup4
+
+    soup = BeautifulSoup(
+        html, "html.parser", parse_only=SoupStrainer(MOD_PAGE_TAGS),
+        from_encoding=encoding if isinstance(html, bytes) else None
+    )
+
+    # Название
+    title_tag = soup.find("div", class_="modtitle")
+    if not title_tag:
+        # Альтернативный способ: ищем h1 или title
+        title_tag = soup.find("h1")
+    name = title_tag.text.strip() if title_tag else "N/A"
+
+    infos = [info.get_text(separator="\n") for info in soup.find_all("div", class_="modinfo")]
+
+    # Прямая ссылка на архив
+    link = soup.find("a", href=ZIP_SUFFIX_RE)
+    return name, infos, (link["href"] if link else None)
+
+
+def conditional_headers(entry):
+    # If-None-Match / If-Modified-Since по сохранённым ETag и Last-Modified
+    headers = {}
+    if entry.get("last_release"):
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def response_validators(response):
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
+
+
+def not_modified(response, headers):
+    # 304, либо 200 с тем же ETag, что был отправлен (сервер или прокси
+    # проигнорировал If-None-Match) — тело не разбираем
+    if response.status_code == 304:
+        return True
+    etag = response.headers.get("ETag")
+    return response.status_code == 200 and bool(etag) and etag == (headers or {}).get("If-None-Match")
+
+
+def parse_farming_simulator_mod(url, session, headers=None):
+    # Возвращает (mod_info, validators); mod_info равен None, если страница
+    # не изменилась (304)
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                          "AppleWebKit/537.36 (KHTML, like Gecko) "
-                          "Chrome/58.0.3029.110 Safari/537.3"
-        }
-        response = requests.get(url, headers=headers)
+        response = session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if not_modified(response, headers):
+            return None, {}
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Название
-        title_tag = soup.find("div", class_="modtitle")
-        if not title_tag:
-            # Альтернативный способ: ищем h1 или title
-            title_tag = soup.find("h1")
-        name = title_tag.text.strip() if title_tag else "N/A"
+        # Байты вместо response.text: страница не декодируется лишний раз в Python
+        # requests подставляет ISO-8859-1, если charset в заголовке нет;
+        # такую догадку не передаём, чтобы парсер учёл <meta charset>
+        content_type = response.headers.get("content-type", "").lower()
+        encoding = response.encoding if "charset" in content_type else None
+        name, infos, zip_url = scan_mod_page(response.content, encoding)
 
         # Версия и дата
         version = "N/A"
         released = "N/A"
-        for info in soup.find_all("div", class_="modinfo"):
-            text = info.get_text(separator="\n")
+        for text in infos:
             for line in text.splitlines():
                 if "Version" in line:
                     version = line.split("Version")[-1].strip()
                 if "Released" in line:
                     released = line.split("Released")[-1].strip()
 
-        # Прямая ссылка на архив
-        zip_url = None
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if href.lower().endswith(".zip"):
-                zip_url = href
-                break
-        if zip_url and zip_url.startswith("/"):
-            zip_url = "https://www.farming-simulator.com" + zip_url
+        if zip_url:
+            # Относительная ссылка (в том числе "//cdn..."), разрешается от адреса страницы
+            zip_url = urljoin(response.url, zip_url)
 
         return {
             "name": name,
@@ -66,19 +340,77 @@ def parse_farming_simulator_mod(url):
             "date": released,
             "asset_url": zip_url,
             "asset_name": zip_url.split("/")[-1] if zip_url else None
-        }
+        }, response_validators(response)
     except Exception as e:
         print("Ошибка парсинга farming-simulator:", e)
+        # Валидаторы сбрасываем, чтобы следующий опрос не получил 304 на ошибку
         return {
             "name": "Ошибка парсинга",
             "version": "N/A",
             "date": "N/A",
             "asset_url": None,
             "asset_name": None
-        }
+        }, {"etag": None, "last_modified": None}
+
+
+MONTHS_RU = (
+    "Января", "Февраля", "Марта", "Апреля", "Мая", "Июня",
+    "Июля", "Августа", "Сентября", "Октября", "Ноября", "Декабря"
+)
+
+
+@functools.lru_cache(maxsize=512)
+def parse_release_date(date_str):
+    # Даты релизов не меняются, поэтому разбор кэшируется
+    try:
+        # ISO-дата GitHub ("2024-01-01T00:00:00Z"); fromisoformat написан на C
+        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    except ValueError:
+        pass
+    try:
+        # Дата с farming-simulator.com ("01.02.2024")
+        return datetime.strptime(date_str, "%d.%m.%Y").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+# Быстрая проверка типичных ссылок (группы — owner и repo); всё остальное
+# проверяет urlparse ниже
+GITHUB_URL_RE = re.compile(r"^(?i:https?://github\.com)/([^/?#]+)/([^/?#]+)")
+FS_URL_RE = re.compile(r"^(?i:https?://(?:www\.)?farming-simulator\.com)/mod\.php\?(?:[^&#]*&)*mod_id=\d+")
+
+
+def days_ago_text(days):
+    if days == 0:
+        return "Сегодня"
+    n = days % 100
+    if 11 <= n <= 14:
+        word = "дней"
+    elif n % 10 == 1:
+        word = "день"
+    elif 2 <= n % 10 <= 4:
+        word = "дня"
+    else:
+        word = "дней"
+    return f"{days} {word} назад"
+
+
+# Готовые подписи для первого года — самый частый случай
+DAYS_AGO_TEXT = {days: days_ago_text(days) for days in range(366)}
+
+
+@functools.lru_cache(maxsize=512)
+def release_date_html(day, month, days_ago):
+    # Результат зависит только от даты и числа прошедших дней, поэтому кэшируется
+    date_formatted = f"{day} {MONTHS_RU[month - 1]}"
+    days_text = DAYS_AGO_TEXT.get(days_ago) or days_ago_text(days_ago)
+    return f"{date_formatted}\n<span style='font-size:small; color:gray;'>({days_text})</span>"
 
 
 def validate_repo_url(url: str) -> bool:
+    if GITHUB_URL_RE.match(url) or FS_URL_RE.match(url):
+        return True
     try:
         parsed = urlparse(url)
         netloc = parsed.netloc.lower()
@@ -102,42 +434,73 @@ def validate_repo_url(url: str) -> bool:
         return False
 
 
-def download_file(url, save_path, signals):
+def github_release(repo, tag_name, published_at, assets):
+    # assets — пары (имя файла, ссылка); в релиз попадает первый zip
+    asset_url = None
+    asset_name = None
+    for name, download_url in assets:
+        if ZIP_SUFFIX_RE.search(name):
+            asset_url = download_url
+            asset_name = name
+            break
+    return {
+        "version": tag_name,
+        "date": published_at,
+        "asset_url": asset_url,
+        "asset_name": asset_name,
+        "name": repo
+    }
+
+
+def repo_kind(url):
+    if "github.com" in url:
+        return "github"
+    if "farming-simulator.com" in url:
+        return "fs"
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def parse_owner_repo(url):
+    match = GITHUB_URL_RE.match(url)
+    if match:
+        return match.group(1), match.group(2)
+    parts = urlparse(url).path.strip("/").split("/")
+    return parts[0], parts[1]
+
+
+def repo_meta(url):
+    # Разбираем URL один раз при добавлении, дальше читаем из записи
+    meta = {"kind": repo_kind(url)}
+    if meta["kind"] == "github":
+        try:
+            meta["owner"], meta["repo"] = parse_owner_repo(url)
+        except IndexError:
+            pass  # Некорректная ссылка
+    return meta
+
+
+def download_file(url, save_path, signals, session):
     try:
-        with requests.get(url, stream=True) as r:
+        with session.get(url, stream=True, timeout=HTTP_TIMEOUT) as r:
             r.raise_for_status()
             total_length = int(r.headers.get('content-length', 0))
-            downloaded = 0
-            start_time = time.time()
-            chunk_size = 8192
-
+            # read() ждёт, пока наберётся весь блок, и файл растёт блоками,
+            # поэтому слишком большой блок на медленном канале замораживает индикатор
+            chunk_size = 256 * 1024
+
+            # Копирование целиком в shutil; прогресс главный поток сам
+            # считывает по размеру файла (см. GitHubTrackerApp.watch_download)
+            signals.download_started.emit(total_length)
+            r.raw.decode_content = True
             with open(save_path, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        percent = int(downloaded * 100 / total_length) if total_length else 0
+                shutil.copyfileobj(r.raw, f, length=chunk_size)
 
-                        elapsed = time.time() - start_time
-                        speed = downloaded / elapsed if elapsed > 0 else 0
-                        speed_kb = speed / 1024
-
-                        remaining_bytes = total_length - downloaded
-                        eta = remaining_bytes / speed if speed > 0 else 0
-
-                        progress_text = (
-                            f"Скачано: {downloaded // 1024} KB / {total_length // 1024} KB | "
-                            f"Скорость: {speed_kb:.2f} KB/s | "
-                            f"Осталось: {int(eta)} сек | {percent}%"
-                        )
-
-                        signals.progress.emit(progress_text)
-
-            signals.progress.emit("Загрузка завершена")
+            signals.download_finished.emit("Загрузка завершена")
     except Exception as e:
-        signals.progress.emit(f"Ошибка при скачивании: {str(e)}")
         if os.path.exists(save_path):
             os.remove(save_path)
+        signals.download_finished.emit(f"Ошибка при скачивании: {str(e)}")
 
 
 class GitHubTrackerApp(QWidget):
@@ -147,12 +510,32 @@ class GitHubTrackerApp(QWidget):
         self.resize(1000, 550)
 
         self.data_file = "repositories.json"
-        self.tracked_repos = self.load_data()
-        self.column_widths = self.tracked_repos.get("_column_widths", {})
+        self._last_hash = None  # хэш последнего записанного/прочитанного содержимого
+        self.tracked_repos, self.column_widths = self.load_data()
+        self.session = None  # создаётся при первом запросе, см. get_session
+        # Опрос упирается в сеть, а не в процессор, поэтому потоков больше,
+        # чем ядер (у глобального пула их ровно столько, сколько ядер)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(8)
+        self._updating = False
+        self._updated = False
+        self._pending = 0
+        self._update_signals = None
+        self._row_by_url = {}
+        self._url_by_row = []
+        self._row_values = {}
+        # Сигналы идущих загрузок: поток их не удерживает после выхода из
+        # download_file, а без ссылки объект удалится вместе с событиями в очереди
+        self._downloads = set()
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._do_save)
 
         self.setup_ui()
         self.update_table()
-        self.update_releases()  # Автообновление при старте
+        QTimer.singleShot(0, self.update_releases)  # Автообновление после показа окна
 
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -190,6 +573,13 @@ class GitHubTrackerApp(QWidget):
         self.table.horizontalHeader().setSectionsMovable(True)
         self.table.horizontalHeader().setStretchLastSection(False)
 
+        # Дата и кнопка рисуются делегатами, без виджетов в каждой строке
+        self.date_delegate = RichTextDelegate(self.table)
+        self.table.setItemDelegateForColumn(2, self.date_delegate)
+        self.download_delegate = ButtonDelegate(self.table)
+        self.download_delegate.clicked.connect(self.download_release)
+        self.table.setItemDelegateForColumn(6, self.download_delegate)
+
         for col in range(self.table.columnCount()):
             width = self.column_widths.get(str(col))
             if width:
@@ -224,9 +614,8 @@ class GitHubTrackerApp(QWidget):
         if item.column() == 0:
             new_name = item.text()
             row = item.row()
-            # Получаем URL репозитория из текущей строки (например, по индексу)
-            # Для этого нужно хранить соответствие row -> url
-            url = self.get_url_by_row(row)
+            # self._url_by_row обновляется в update_table вместе со строками таблицы
+            url = self._url_by_row[row] if 0 <= row < len(self._url_by_row) else None
             if url:
                 # Обновляем поле name в last_release
                 if "last_release" in self.tracked_repos[url]:
@@ -234,14 +623,6 @@ class GitHubTrackerApp(QWidget):
                     self.save_data()
                     self.status_label.setText(f"Название репозитория обновлено: {new_name}")
 
-    def get_url_by_row(self, row):
-        # Поскольку порядок строк в таблице совпадает с порядком в self.tracked_repos (без _column_widths),
-        # можно получить URL так:
-        keys = [k for k in self.tracked_repos.keys() if k != "_column_widths"]
-        if 0 <= row < len(keys):
-            return keys[row]
-        return None
-
     def on_selection_changed(self):
         selected = self.table.selectionModel().hasSelection()
         self.btn_delete.setEnabled(selected)
@@ -250,7 +631,6 @@ class GitHubTrackerApp(QWidget):
         self.column_widths = {}
         for col in range(self.table.columnCount()):
             self.column_widths[str(col)] = self.table.columnWidth(col)
-        self.tracked_repos["_column_widths"] = self.column_widths
         self.save_data()
 
     def add_repo_from_input(self):
@@ -265,7 +645,7 @@ class GitHubTrackerApp(QWidget):
             self.status_label.setText("Репозиторий или мод уже отслеживается")
             return
 
-        self.tracked_repos[url] = {"last_release": None, "previous_release": None}
+        self.tracked_repos[url] = {"last_release": None, "previous_release": None, **repo_meta(url)}
         self.save_data()
         self.update_table()
         self.url_input.clear()
@@ -277,25 +657,8 @@ class GitHubTrackerApp(QWidget):
             self.status_label.setText("Выберите репозиторий или мод для удаления")
             return
 
-        urls_to_delete = []
-        for row in selected_rows:
-            repo_name = self.table.item(row, 0).text()
-            for url in self.tracked_repos:
-                if url == "_column_widths":
-                    continue
-                if "github.com" in url:
-                    try:
-                        owner, repo = self.get_owner_repo(url)
-                    except IndexError:
-                        continue  # Пропускаем некорректные ссылки
-                    if repo == repo_name:
-                        urls_to_delete.append(url)
-                        break
-                elif "farming-simulator.com" in url:
-                    name = self.tracked_repos[url].get("last_release", {}).get("name", "")
-                    if name == repo_name:
-                        urls_to_delete.append(url)
-                        break
+        # Строка таблицы однозначно определяет URL, даже если названия совпадают
+        urls_to_delete = [self._url_by_row[row] for row in selected_rows if row < len(self._url_by_row)]
 
         for url in urls_to_delete:
             self.tracked_repos.pop(url, None)
@@ -304,175 +667,340 @@ class GitHubTrackerApp(QWidget):
         self.status_label.setText("Выбранные репозитории или моды удалены")
 
     def update_releases(self):
-        updated = False
-        for url in list(self.tracked_repos.keys()):
-            if url == "_column_widths":
-                continue
+        if self._updating:
+            return
+        jobs = []
+        for url in self.tracked_repos:
+            kind = self.tracked_repos[url].get("kind")
+            if kind in ("github", "fs"):
+                jobs.append((url, kind))
+
+        self._updating = True
+        self._updated = False
+        self._pending = len(jobs)
+        self.btn_update.setEnabled(False)
+        self.status_label.setText("Проверка обновлений...")
+        if not jobs:
+            self.finish_update()
+            return
+
+        signals = WorkerSignals()
+        signals.result.connect(self.apply_release)
+        self._update_signals = signals  # держим ссылку, пока опрос не завершится
+
+        # Qt-виджеты из рабочих потоков не трогаем
+        self.get_session()
+        pool = self._pool
+        token = os.environ.get("GITHUB_TOKEN")
+        batched = []
+        if token:
+            batched = [url for url, kind in jobs
+                       if kind == "github" and self.tracked_repos[url].get("owner") and self.tracked_repos[url].get("repo")]
+            for i in range(0, len(batched), GITHUB_GRAPHQL_BATCH):
+                pool.start(GitHubBatchRunnable(self.fetch_github_batch, batched[i:i + GITHUB_GRAPHQL_BATCH], token, signals))
+        batched = set(batched)
+        # Остальное — по одной задаче на URL
+        for url, kind in jobs:
+            if url not in batched:
+                pool.start(ReleasePollRunnable(self.fetch_release, url, kind, signals))
+
+    def fetch_release(self, url, kind):
+        # Выполняется в рабочем потоке: только сеть и разбор ответа.
+        # Возвращает (url, release, error, validators); release и error оба None,
+        # если сервер ответил 304 и релиз не изменился.
+        try:
+            if kind == "github":
+                owner, repo = self.get_owner_repo(url)
+                api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+                # Условный запрос: 304 не расходует лимит GitHub API
+                headers = conditional_headers(self.tracked_repos.get(url) or {})
+                response = self.session.get(api_url, headers=headers, timeout=HTTP_TIMEOUT)
+                if not_modified(response, headers):
+                    return url, None, None, {}
+                if response.status_code != 200:
+                    return url, None, f"Ошибка получения релизов для {owner}/{repo}", {}
+                validators = response_validators(response)
+                latest = response.json()
+                assets = ((asset["name"], asset["browser_download_url"]) for asset in latest.get("assets", []))
+                release = github_release(repo, latest.get("tag_name"), latest.get("published_at", ""), assets)
+                return url, release, None, validators
+            headers = conditional_headers(self.tracked_repos.get(url) or {})
+            mod_info, validators = parse_farming_simulator_mod(url, self.session, headers)
+            if mod_info is None:
+                return url, None, None, {}
+            return url, {
+                "version": mod_info["version"],
+                "date": mod_info["date"],
+                "asset_url": mod_info["asset_url"],
+                "asset_name": mod_info["asset_name"],
+                "name": mod_info["name"]
+            }, None, validators
+        except Exception as e:
+            return url, None, f"Ошибка при обновлении {url}: {e}", {}
+
+    def fetch_github_batch(self, urls, token):
+        # Выполняется в рабочем потоке: один GraphQL-запрос на пачку репозиториев
+        # На каждый URL возвращается ровно один результат, иначе счётчик
+        # _pending не дойдёт до нуля и обновление не завершится
+        try:
+            params = []
+            fields = []
+            variables = {}
+            for i, url in enumerate(urls):
+                owner, repo = self.get_owner_repo(url)
+                params.append(f"$o{i}: String!, $n{i}: String!")
+                fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {GITHUB_RELEASE_FIELDS} }}")
+                variables[f"o{i}"] = owner
+                variables[f"n{i}"] = repo
+            query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+            response = self.session.post(
+                GITHUB_GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                headers={"Authorization": f"bearer {token}"},
+                timeout=HTTP_TIMEOUT
+            )
+            response.raise_for_status()
+            data = response.json().get("data")
+            if not isinstance(data, dict):
+                raise ValueError("пустой ответ GraphQL")
+        except Exception as e:
+            print("Ошибка GraphQL, опрос через REST:", e)
+            return [self.fetch_release(url, "github") for url in urls]
+
+        results = []
+        for i, url in enumerate(urls):
             try:
-                if "github.com" in url:
-                    owner, repo = self.get_owner_repo(url)
-                    api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-                    response = requests.get(api_url, headers={"Accept": "application/vnd.github+json"})
-                    if response.status_code == 200:
-                        latest = response.json()
-                        current = self.tracked_repos[url].get("last_release") or {}
-                        new_version = latest.get("tag_name")
-                        asset_url = None
-                        asset_name = None
-                        for asset in latest.get("assets", []):
-                            if asset["name"].lower().endswith(".zip"):
-                                asset_url = asset["browser_download_url"]
-                                asset_name = asset["name"]
-                                break
-                        if new_version != current.get("version") or asset_url != current.get("asset_url"):
-                            self.tracked_repos[url]["previous_release"] = current.copy()
-                            self.tracked_repos[url]["last_release"] = {
-                                "version": new_version,
-                                "date": latest.get("published_at", ""),
-                                "asset_url": asset_url,
-                                "asset_name": asset_name,
-                                "is_new": True,
-                                "name": repo
-                            }
-                            updated = True
-                        else:
-                            self.tracked_repos[url]["last_release"]["is_new"] = False
-                    else:
-                        self.status_label.setText(f"Ошибка получения релизов для {owner}/{repo}")
-                elif "farming-simulator.com" in url:
-                    mod_info = parse_farming_simulator_mod(url)
-                    current = self.tracked_repos[url].get("last_release") or {}
-                    new_version = mod_info["version"]
-                    asset_url = mod_info["asset_url"]
-                    asset_name = mod_info["asset_name"]
-                    if new_version != current.get("version") or asset_url != current.get("asset_url"):
-                        self.tracked_repos[url]["previous_release"] = current.copy()
-                        self.tracked_repos[url]["last_release"] = {
-                            "version": new_version,
-                            "date": mod_info["date"],
-                            "asset_url": asset_url,
-                            "asset_name": asset_name,
-                            "is_new": True,
-                            "name": mod_info["name"]
-                        }
-                        updated = True
-                    else:
-                        self.tracked_repos[url]["last_release"]["is_new"] = False
+                owner, repo = self.get_owner_repo(url)
+                latest = (data.get(f"r{i}") or {}).get("latestRelease")
+                if not latest:
+                    results.append((url, None, f"Ошибка получения релизов для {owner}/{repo}", {}))
+                    continue
+                assets = [(asset["name"], asset["downloadUrl"]) for asset in latest["releaseAssets"]["nodes"]]
+                release = github_release(repo, latest["tagName"], latest.get("publishedAt") or "", assets)
+                results.append((url, release, None, {}))
             except Exception as e:
-                self.status_label.setText(f"Ошибка при обновлении {url}: {e}")
-
+                results.append((url, None, f"Ошибка при обновлении {url}: {e}", {}))
+        return results
+
+    def apply_release(self, result):
+        # Вызывается в главном потоке по мере прихода результатов
+        url, release, error, validators = result
+        self._pending -= 1
+        if url in self.tracked_repos:  # Мог быть удалён, пока шёл запрос
+            if error:
+                self.status_label.setText(error)
+            elif release is None:
+                # 304 Not Modified
+                if self.tracked_repos[url].get("last_release"):
+                    self.tracked_repos[url]["last_release"]["is_new"] = False
+            else:
+                self.tracked_repos[url].update(validators)
+                current = self.tracked_repos[url].get("last_release") or {}
+                if release["version"] != current.get("version") or release["asset_url"] != current.get("asset_url"):
+                    self.tracked_repos[url]["previous_release"] = current.copy()
+                    self.tracked_repos[url]["last_release"] = dict(release, is_new=True)
+                    self._updated = True
+                elif self.tracked_repos[url].get("last_release"):
+                    self.tracked_repos[url]["last_release"]["is_new"] = False
+            self.update_url_row(url)
+        if self._pending == 0:
+            self.finish_update()
+
+    def finish_update(self):
+        self._updating = False
+        self.btn_update.setEnabled(True)
         self.save_data()
         self.update_table()
-        if updated:
+        if self._updated:
             self.status_label.setText("Найдены новые версии!")
         else:
             self.status_label.setText("Все репозитории и моды актуальны.")
 
-    def format_release_date(self, date_str):
+    def format_release_date(self, date_str, now=None):
         if not date_str:
             return "N/A"
         try:
-            dt = None
-            # Попытка распарсить дату в разных форматах
-            for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%d.%m.%Y"):
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    break
-                except:
-                    pass
+            dt = parse_release_date(date_str)
             if dt is None:
                 return date_str
 
-            dt = dt.replace(tzinfo=timezone.utc)
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = datetime.now(timezone.utc)
             delta = now - dt
-            days_ago = delta.days
-
-            months = [
-                "Января", "Февраля", "Марта", "Апреля", "Мая", "Июня",
-                "Июля", "Августа", "Сентября", "Октября", "Ноября", "Декабря"
-            ]
-            day = dt.day
-            month_name = months[dt.month - 1]
-            date_formatted = f"{day} {month_name}"
-
-            if days_ago == 0:
-                days_text = "Сегодня"
-            elif days_ago == 1:
-                days_text = "1 день назад"
-            elif 2 <= days_ago <= 4:
-                days_text = f"{days_ago} дня назад"
-            else:
-                days_text = f"{days_ago} дней назад"
-
-            return f"{date_formatted}\n<span style='font-size:small; color:gray;'>({days_text})</span>"
+            return release_date_html(dt.day, dt.month, delta.days)
         except Exception:
             return date_str
 
-    def update_table(self):
-        self.table.setRowCount(0)
-        for url, data in self.tracked_repos.items():
-            if url == "_column_widths":
-                continue
-            release = data.get("last_release") or {}
-            prev_release = data.get("previous_release") or {}
-
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+    def row_values(self, data, now):
+        release = data.get("last_release") or {}
+        prev_release = data.get("previous_release") or {}
+        return (
+            release.get("name", "N/A"),
+            release.get("version", "N/A"),
+            self.format_release_date(release.get("date", ""), now),  # Дата релиза с форматированием
+            prev_release.get("version", "N/A"),
+            (prev_release.get("date") or "N/A")[:10],
+            release.get("asset_name", "N/A"),
+            release.get("is_new", False)
+        )
 
+    def update_table(self):
+        # Таблица не перестраивается целиком: добавляются только новые строки,
+        # у существующих меняются лишь те ячейки, значения которых изменились
+        now = datetime.now(timezone.utc)
+        urls = list(self.tracked_repos)
 
-
-            # Имя репозитория или мода
-            name = release.get("name", "N/A")
-            self.table.setItem(row, 0, QTableWidgetItem(name))
-            self.table.setItem(row, 1, QTableWidgetItem(release.get("version", "N/A")))
-
-            # Дата релиза с форматированием
-            date_html = self.format_release_date(release.get("date", ""))
-            label = QLabel()
-            label.setTextFormat(Qt.RichText)
-            label.setText(date_html)
-            label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            self.table.setCellWidget(row, 2, label)
-
-            self.table.setItem(row, 3, QTableWidgetItem(prev_release.get("version", "N/A")))
-            self.table.setItem(row, 4, QTableWidgetItem((prev_release.get("date") or "N/A")[:10]))
-
-            asset_name = release.get("asset_name", "N/A")
-            link_item = QTableWidgetItem(asset_name)
-            link_item.setFlags(link_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 5, link_item)
-
-            btn_download = QPushButton("Скачать")
-            btn_download.clicked.connect(lambda checked, u=url: self.download_release(u))
-            self.table.setCellWidget(row, 6, btn_download)
-
-            item = QTableWidgetItem(name)
-            item.setFlags(item.flags() | Qt.ItemIsEditable)  # Разрешаем редактирование
-            self.table.setItem(row, 0, item)
-
-            if release.get("is_new", False):
-                btn_download.setStyleSheet("background-color: yellow")
-            else:
-                btn_download.setStyleSheet("")
+        self.table.blockSignals(True)
+        try:
+            # Строки удалённых убираем снизу вверх, чтобы индексы не съезжали
+            removed = [url for url in self._row_by_url if url not in self.tracked_repos]
+            for url in sorted(removed, key=self._row_by_url.get, reverse=True):
+                self.table.removeRow(self._row_by_url.pop(url))
+                self._row_values.pop(url, None)
+
+            kept = sorted(self._row_by_url, key=self._row_by_url.get)
+            if urls[:len(kept)] != kept:
+                # Порядок строк разошёлся с данными — проще построить заново
+                self.table.setRowCount(0)
+                self._row_by_url.clear()
+                self._row_values.clear()
+
+            for row, url in enumerate(urls):
+                values = self.row_values(self.tracked_repos[url], now)
+                if url not in self._row_by_url:
+                    self.insert_row(row, url, values)
+                elif values != self._row_values[url]:
+                    self.refresh_row(row, values, self._row_values[url])
+                self._row_by_url[url] = row
+                self._row_values[url] = values
+            self._url_by_row = urls
+        finally:
+            self.table.blockSignals(False)
+
+    def insert_row(self, row, url, values):
+        name, version, date_html, prev_version, prev_date, asset_name, is_new = values
+        self.table.insertRow(row)
+
+        # Имя репозитория или мода
+        item = QTableWidgetItem(name)
+        item.setFlags(item.flags() | Qt.ItemIsEditable)  # Разрешаем редактирование
+        self.table.setItem(row, 0, item)
+        self.table.setItem(row, 1, QTableWidgetItem(version))
+
+        date_item = QTableWidgetItem(date_html)
+        date_item.setFlags(date_item.flags() & ~Qt.ItemIsEditable)
+        self.table.setItem(row, 2, date_item)
+
+        self.table.setItem(row, 3, QTableWidgetItem(prev_version))
+        self.table.setItem(row, 4, QTableWidgetItem(prev_date))
+
+        link_item = QTableWidgetItem(asset_name)
+        link_item.setFlags(link_item.flags() & ~Qt.ItemIsEditable)
+        self.table.setItem(row, 5, link_item)
+
+        download_item = QTableWidgetItem("Скачать")
+        download_item.setFlags(download_item.flags() & ~Qt.ItemIsEditable)
+        download_item.setData(URL_ROLE, url)
+        download_item.setData(IS_NEW_ROLE, is_new)
+        self.table.setItem(row, 6, download_item)
+
+    def update_url_row(self, url):
+        # Изменились данные только одного URL — остальные строки не пересчитываем
+        row = self._row_by_url.get(url)
+        if row is None:
+            self.update_table()
+            return
+        values = self.row_values(self.tracked_repos[url], datetime.now(timezone.utc))
+        if values == self._row_values[url]:
+            return
+        self.table.blockSignals(True)
+        try:
+            self.refresh_row(row, values, self._row_values[url])
+        finally:
+            self.table.blockSignals(False)
+        self._row_values[url] = values
+
+    def refresh_row(self, row, values, old_values):
+        for col in range(6):
+            if values[col] != old_values[col]:
+                self.table.item(row, col).setText(values[col])
+        if values[6] != old_values[6]:
+            self.table.item(row, 6).setData(IS_NEW_ROLE, values[6])
+
+    def get_session(self):
+        # Вызывается только из главного потока, поэтому сессия создаётся один раз
+        if self.session is None:
+            self.session = create_session()
+        return self.session
 
     def get_owner_repo(self, url):
-        parts = urlparse(url).path.strip("/").split("/")
-        return parts[0], parts[1]
+        entry = self.tracked_repos.get(url) or {}
+        if entry.get("owner") and entry.get("repo"):
+            return entry["owner"], entry["repo"]
+        return parse_owner_repo(url)
 
     def load_data(self):
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        # Возвращает (репозитории, ширины столбцов)
+        if not os.path.exists(self.data_file):
+            return {}, {}
+        try:
+            with open(self.data_file, "rb") as f:
+                raw = f.read()
+            self._last_hash = hashlib.blake2b(raw).digest()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception:
+            return {}, {}
+        if isinstance(data.get("repos"), dict):
+            repos = data["repos"]
+            column_widths = data.get("column_widths", {})
+        else:
+            # Старый формат: ширины столбцов лежали среди репозиториев
+            column_widths = data.pop("_column_widths", {})
+            repos = data
+        # Записи из старых файлов дополняем типом и owner/repo один раз
+        for url, entry in repos.items():
+            if "kind" not in entry:
+                entry.update(repo_meta(url))
+        return repos, column_widths
 
     def save_data(self):
-        self.tracked_repos["_column_widths"] = self.column_widths
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            json.dump(self.tracked_repos, f, ensure_ascii=False, indent=2)
+        # Запись откладывается: серия изменений (например, перетаскивание
+        # границы столбца) даёт одну запись на диск
+        self._save_timer.start()
+
+    def _do_save(self):
+        self._save_timer.stop()
+        data = {"repos": self.tracked_repos, "column_widths": self.column_widths}
+        # Пишем во временный файл и подменяем, чтобы не испортить JSON при сбое
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        # Содержимое не изменилось (например, столбец вернули к прежней
+        # ширине) — файл не трогаем
+        new_hash = hashlib.blake2b(payload).digest()
+        if new_hash == self._last_hash:
+            return
+        tmp_path = self.data_file + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.data_file)
+        self._last_hash = new_hash
+
+    def closeEvent(self, event):
+        # Задачи опроса, которые ещё не начались, отменяем; результаты уже
+        # идущих больше не применяем — окно закрывается. Каждая задача может
+        # висеть до таймаута чтения с повторами, поэтому ждём их недолго;
+        # не успевшие завершиться задерживают выход из процесса, пока не
+        # закончится их запрос, но в окно уже ничего не пишут
+        self._pool.clear()
+        if self._update_signals is not None:
+            self._update_signals.result.disconnect(self.apply_release)
+            self._update_signals = None  # сам объект удерживают задачи
+        self._pool.waitForDone(2000)
+        if self._save_timer.isActive():
+            self._do_save()
+        super().closeEvent(event)
 
     def download_release(self, url):
         release = self.tracked_repos[url].get("last_release")
@@ -488,14 +1016,69 @@ class GitHubTrackerApp(QWidget):
 
         self.status_label.setText(f"Начинается скачивание {filename}...")
 
+        session = self.get_session()
         signals = WorkerSignals()
         signals.progress.connect(self.status_label.setText)
+        self._downloads.add(signals)
+        # Подключаемся до запуска потока: иначе быстрая или сразу упавшая
+        # загрузка может прислать download_finished раньше, чем таймер узнает о нём
+        self.watch_download(save_path, signals)
 
         def thread_func():
-            download_file(asset_url, save_path, signals)
+            download_file(asset_url, save_path, signals, session)
 
         threading.Thread(target=thread_func, daemon=True).start()
 
+    def watch_download(self, save_path, signals):
+        # 10 раз в секунду показываем прогресс по размеру файла на диске.
+        # Таймер запускается по download_started, когда известен размер файла
+        start_time = time.monotonic()
+        total_length = 0
+        total_kb = 0
+        timer = QTimer(self)
+        timer.setInterval(100)
+
+        def start(total):
+            nonlocal start_time, total_length, total_kb
+            start_time = time.monotonic()
+            total_length = total
+            total_kb = total // 1024
+            timer.start()
+
+        def show_progress():
+            try:
+                downloaded = os.path.getsize(save_path)
+            except OSError:
+                return
+            percent = int(downloaded * 100 / total_length) if total_length else 0
+
+            elapsed = time.monotonic() - start_time
+            speed = downloaded / elapsed if elapsed > 0 else 0
+            speed_kb = speed / 1024
+
+            remaining_bytes = total_length - downloaded
+            eta = remaining_bytes / speed if speed > 0 else 0
+
+            self.status_label.setText(
+                f"Скачано: {downloaded // 1024} KB / {total_kb} KB | "
+                f"Скорость: {speed_kb:.2f} KB/s | "
+                f"Осталось: {int(eta)} сек | {percent}%"
+            )
+
+        def stop(message):
+            # Итоговый размер показываем один раз, затем его заменяет
+            # сообщение о завершении или ошибке
+            if timer.isActive():
+                timer.stop()
+                show_progress()
+            timer.deleteLater()
+            self.status_label.setText(message)
+            self._downloads.discard(signals)
+
+        timer.timeout.connect(show_progress)
+        signals.download_started.connect(start)
+        signals.download_finished.connect(stop)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)